@@ -1,4 +1,4 @@
-from .play_sutom import play
+from .play_sutom import play, play_multi
 from .player import PlayerKind
 
-__all__ = ["play", "PlayerKind"]
+__all__ = ["PlayerKind", "play", "play_multi"]
@@ -0,0 +1,78 @@
+from collections import defaultdict
+
+from src.sutom_engine import (
+    GuessResult,
+    LetterStatus,
+    feedback_pattern,
+    guess_result_from_pattern,
+    perfect_pattern,
+)
+
+
+class AdversarialSutomFSM:
+    """Sutom 'host' which never commits to a ground-truth word.
+
+    It keeps the pool of words still consistent with the feedback given so
+    far. After each guess, the pool is bucketed by feedback pattern and the
+    host answers with the pattern of the largest bucket, which becomes the
+    new pool. The number of guesses a player needs against this host is its
+    worst case against a greedy adversary: a lower bound on its true worst
+    case, as a smaller bucket now can lead to a longer game later.
+    """
+
+    def __init__(self, gt_length: int, first_letter: str, vocab: list[str]):
+        self.gt_length = gt_length
+        self.first_letter = first_letter
+
+        # sorted, so that the host's choices do not depend on the vocab order
+        self.candidates = sorted(
+            w for w in vocab if len(w) == gt_length and w[0] == first_letter
+        )
+        assert len(self.candidates) > 0, (
+            f"No {gt_length}-letter word starting with '{first_letter}' in the vocab"
+        )
+
+        self.past_results: list[GuessResult] = []
+
+    @property
+    def past_guesses(self) -> list[str]:
+        return [past_res.guess for past_res in self.past_results]
+
+    @property
+    def is_solved(self) -> bool:
+        return len(self.past_results) > 0 and self.past_results[-1].is_perfect
+
+    @property
+    def state_of_prediction(self) -> list[tuple[str, LetterStatus]]:
+        # no ground-truth: only report the letters found as perfect matches
+        preds = [(" ", LetterStatus.NOT_FOUND) for _ in range(self.gt_length)]
+        for past_res in self.past_results:
+            for letter_res in past_res.results:
+                if letter_res.status == LetterStatus.PERFECT_MATCH:
+                    preds[letter_res.position] = (
+                        letter_res.letter,
+                        LetterStatus.PERFECT_MATCH,
+                    )
+        return preds
+
+    def guess(self, guess: str) -> GuessResult:
+        assert len(guess) == self.gt_length, (
+            "Guess word must have the same length as the ground truth word"
+        )
+
+        buckets: dict[int, list[str]] = defaultdict(list)
+        for candidate in self.candidates:
+            buckets[feedback_pattern(guess, candidate)].append(candidate)
+
+        # keep the largest surviving pool. Ties are broken against the player
+        # (a winning pattern comes last), then on the pattern value.
+        win = perfect_pattern(self.gt_length)
+        pattern = max(
+            buckets,
+            key=lambda p: (len(buckets[p]), p != win, -p),
+        )
+        self.candidates = buckets[pattern]
+
+        res = guess_result_from_pattern(guess, pattern)
+        self.past_results.append(res)
+        return res
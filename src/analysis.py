@@ -0,0 +1,110 @@
+import heapq
+from dataclasses import dataclass
+
+from src.info_theoretic_player import (
+    InfoTheory,
+    filter_vocab_on_size,
+    letter_elimination_table,
+)
+from src.sutom_engine import GuessResult, pattern_from_guess_result
+
+# (gt_length, first_letter, ((guess, packed feedback), ...))
+PoolKey = tuple[int, str, tuple[tuple[str, int], ...]]
+
+
+@dataclass(frozen=True)
+class AnalysisState:
+    "An external, possibly partial, game state"
+
+    gt_length: int
+    first_letter: str
+    past_results: list[GuessResult]
+
+
+@dataclass(frozen=True)
+class Analysis:
+    top_guesses: list[tuple[str, float]]  # (guess, score), best first
+    pool_size: int  # number of potential answers left
+
+
+def filter_pool(
+    pool: list[str], gt_length: int, past_guess_results: list[GuessResult]
+) -> list[str]:
+    "Filter 'pool' with the same logic as the InfoTheory player"
+    player = InfoTheory(gt_length=gt_length, vocab=pool, save_dir=None)
+    player.update_potential_answers(past_guess_results)
+    return player.potential_answers
+
+
+def analyze_states(
+    states: list[AnalysisState], *, vocab: list[str], top_k: int = 5
+) -> list[Analysis]:
+    """Best next guesses and remaining pool size, for each state.
+
+    The pool of potential answers of a state is narrowed guess by guess, like
+    the InfoTheory player does during a game. Pools are cached per history
+    prefix, so states sharing a prefix (or identical states) only filter
+    and score once.
+    """
+    vocab_per_length: dict[int, list[str]] = {}
+    pools: dict[PoolKey, list[str]] = {}
+    analyses: dict[PoolKey, Analysis] = {}
+
+    def get_pool(state: AnalysisState) -> tuple[PoolKey, list[str]]:
+        history = tuple(
+            (res.guess, pattern_from_guess_result(res)) for res in state.past_results
+        )
+
+        def prefix_key(nb_turns: int) -> PoolKey:
+            return (state.gt_length, state.first_letter, history[:nb_turns])
+
+        if prefix_key(0) not in pools:
+            pools[prefix_key(0)] = [
+                w
+                for w in vocab_per_length[state.gt_length]
+                if w[0] == state.first_letter
+            ]
+
+        # start from the longest cached prefix, then filter guess by guess
+        nb_cached = len(history)
+        while prefix_key(nb_cached) not in pools:
+            nb_cached -= 1
+        pool = pools[prefix_key(nb_cached)]
+        for nb_turns in range(nb_cached + 1, len(history) + 1):
+            pool = filter_pool(pool, state.gt_length, state.past_results[:nb_turns])
+            pools[prefix_key(nb_turns)] = pool
+
+        return prefix_key(len(history)), pool
+
+    results = []
+    for state in states:
+        if state.gt_length not in vocab_per_length:
+            vocab_per_length[state.gt_length] = filter_vocab_on_size(
+                state.gt_length, vocab
+            )
+
+        key, pool = get_pool(state)
+        if key not in analyses:
+            analyses[key] = score_pool(
+                pool, vocab_per_length[state.gt_length], state.gt_length, top_k
+            )
+        results.append(analyses[key])
+    return results
+
+
+def score_pool(
+    pool: list[str], guess_vocab: list[str], gt_length: int, top_k: int
+) -> Analysis:
+    # nothing left to discriminate: the answer is known (or the state is inconsistent)
+    if len(pool) <= 1:
+        return Analysis(top_guesses=[(w, 0.0) for w in pool], pool_size=len(pool))
+
+    table = letter_elimination_table(pool, gt_length)
+    scores = (
+        (w, sum(row.get(letter, 0.0) for row, letter in zip(table, w)))
+        for w in guess_vocab
+    )
+    return Analysis(
+        top_guesses=heapq.nlargest(top_k, scores, key=lambda item: item[1]),
+        pool_size=len(pool),
+    )
@@ -0,0 +1,86 @@
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.adversarial_engine import AdversarialSutomFSM
+from src.info_theoretic_player import InfoTheory
+from src.play_sutom import MAX_ITER, VOCAB_PATH
+from src.play_utils import load_input_vocab
+from src.player import Player
+
+# Builds a fresh player from the ground-truth length and the vocab
+PlayerFactory = Callable[[int, list[str]], Player]
+
+
+def headless_info_theory(gt_length: int, vocab: list[str]) -> Player:
+    return InfoTheory(gt_length=gt_length, vocab=vocab, save_dir=None)
+
+
+def play_adversarial(
+    player: Player, host: AdversarialSutomFSM, max_iter: int = MAX_ITER
+) -> int | None:
+    """Play a game against the adversarial host, without any rendering.
+
+    Returns the number of guesses needed to win, or None if the player did
+    not win within 'max_iter' guesses.
+    """
+    for iter in range(1, max_iter + 1):
+        guess = player.guess(host.past_results)
+        if len(guess) != host.gt_length:
+            return None
+
+        host.guess(guess)
+        if host.is_solved:
+            return iter
+    return None
+
+
+def worst_case_for_length(
+    gt_length: int,
+    vocab: list[str],
+    player_factory: PlayerFactory = headless_info_theory,
+    max_iter: int = MAX_ITER,
+) -> dict[str, int | None]:
+    """Worst-case guess count against a greedy adversary, for each first letter
+    of the 'gt_length'-letter words"""
+    first_letters = sorted({w[0] for w in vocab if len(w) == gt_length})
+
+    worst_cases: dict[str, int | None] = {}
+    for first_letter in first_letters:
+        host = AdversarialSutomFSM(gt_length, first_letter, vocab)
+        player = player_factory(gt_length, vocab)
+        worst_cases[first_letter] = play_adversarial(player, host, max_iter)
+    return worst_cases
+
+
+def evaluate_worst_case(
+    lengths: list[int],
+    *,
+    player_factory: PlayerFactory = headless_info_theory,
+    vocab_path: Path = VOCAB_PATH,
+    max_iter: int = MAX_ITER,
+    max_workers: int | None = None,
+) -> dict[int, dict[str, int | None]]:
+    """Worst-case guess count against a greedy adversary (a lower bound on the
+    true worst case) per length and first letter, None meaning the player
+    failed to win against it within 'max_iter' guesses.
+
+    Lengths are evaluated in parallel, one process each. 'player_factory'
+    must be picklable, i.e. a module-level function.
+    """
+    vocab = load_input_vocab(vocab_path)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            gt_length: executor.submit(
+                worst_case_for_length, gt_length, vocab, player_factory, max_iter
+            )
+            for gt_length in lengths
+        }
+        return {gt_length: future.result() for gt_length, future in futures.items()}
+
+
+if __name__ == "__main__":
+    results = evaluate_worst_case(lengths=list(range(5, 10)))
+    for gt_length, worst_cases in results.items():
+        print(f"{gt_length} letters: {worst_cases}")
@@ -0,0 +1,83 @@
+import json
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from src.sutom_engine import GuessResult, guess_result_from_pattern
+
+# One JSON object per line, appended as the game goes:
+#   {"type": "game", "game_id": ..., "ground_truth": ..., "player": {...}}
+#   {"type": "turn", "game_id": ..., "turn": 1, "guess": ..., "feedback": 242, "timings": {...}}
+# 'feedback' is the packed pattern of 'src.sutom_engine.feedback_pattern'.
+# 'timings' holds the seconds spent per phase: "guess" (the player's decision,
+# excluding "save_scores", the time spent saving its scores) and "feedback".
+
+
+@dataclass(frozen=True)
+class TurnRecord:
+    turn: int  # 1-indexed
+    guess: str
+    feedback: int  # packed feedback pattern
+    timings: dict[str, float]  # phase -> seconds
+
+    @property
+    def guess_result(self) -> GuessResult:
+        return guess_result_from_pattern(self.guess, self.feedback)
+
+
+@dataclass
+class GameRecord:
+    game_id: str
+    ground_truth: str
+    player: dict  # player config, e.g. {"kind": "ai", "vocab_path": ...}
+    turns: list[TurnRecord] = field(default_factory=list)
+
+    @property
+    def past_results(self) -> list[GuessResult]:
+        return [turn.guess_result for turn in self.turns]
+
+
+class GameLogger:
+    "Append-only writer of the game log"
+
+    def __init__(self, log_path: Path):
+        log_path.parent.mkdir(exist_ok=True, parents=True)
+        self.log_path = log_path
+
+    def _append(self, record: dict):
+        with open(self.log_path, "a") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def start_game(self, ground_truth: str, player: dict) -> str:
+        game_id = uuid.uuid4().hex
+        self._append(
+            {
+                "type": "game",
+                "game_id": game_id,
+                "ground_truth": ground_truth,
+                "player": player,
+            }
+        )
+        return game_id
+
+    def log_turn(self, game_id: str, turn: TurnRecord):
+        self._append({"type": "turn", "game_id": game_id, **asdict(turn)})
+
+
+def read_game_log(log_path: Path) -> list[GameRecord]:
+    "Read back all the games of a log, in order"
+    games: dict[str, GameRecord] = {}
+    with open(log_path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            match record.pop("type"):
+                case "game":
+                    games[record["game_id"]] = GameRecord(**record)
+                case "turn":
+                    game_id = record.pop("game_id")
+                    games[game_id].turns.append(TurnRecord(**record))
+                case other:
+                    raise ValueError(f"Unknown record type in game log: {other}")
+    return list(games.values())
@@ -1,4 +1,6 @@
 import json
+import time
+from collections import Counter
 from functools import lru_cache
 from itertools import chain
 from pathlib import Path
@@ -21,36 +23,58 @@ def flatten(list_of_lists):
     return chain.from_iterable(list_of_lists)
 
 
+def letter_elimination_table(
+    potential_answers: list[str], gt_length: int
+) -> list[dict[str, float]]:
+    """Expected number of words eliminated by each letter at each position,
+    i.e. table[idx][letter], for the given pool of potential answers.
+
+    Same 3-term expectation as
+    'InfoTheory.compute_expected_word_eliminated_by_letter_at_idx', but all
+    counts are gathered in a single pass over the pool. Letters absent from
+    the pool eliminate nothing and are left out of the table.
+    """
+    n = len(potential_answers)
+    count_at_idx = [
+        Counter(w[idx] for w in potential_answers) for idx in range(gt_length)
+    ]
+    count_in_word = Counter(letter for w in potential_answers for letter in set(w))
+
+    table: list[dict[str, float]] = []
+    for idx in range(gt_length):
+        row: dict[str, float] = {}
+        for letter, n_with in count_in_word.items():
+            n_at = count_at_idx[idx][letter]
+            term_perfect_match = n_at * (n - n_at)
+            term_not_in_gt = (n - n_with) * n_with
+            term_incorrect_position = (n_with - n_at) * (n - n_with + n_at)
+            row[letter] = (
+                term_perfect_match + term_not_in_gt + term_incorrect_position
+            ) / n
+        table.append(row)
+    return table
+
+
 class InfoTheory(Player):
-    def __init__(self, gt_length: int, vocab: list[str], save_dir: Path):
+    def __init__(self, gt_length: int, vocab: list[str], save_dir: Path | None):
         self.gt_length = gt_length
         self.vocab = filter_vocab_on_size(gt_length, vocab)
 
         self.potential_answers = self.vocab
 
-        save_dir.mkdir(exist_ok=True, parents=True)
+        # no 'save_dir' means headless: the scores are not saved
+        if save_dir is not None:
+            save_dir.mkdir(exist_ok=True, parents=True)
         self.save_dir = save_dir
 
-    def guess(self, past_guess_results: list[GuessResult]) -> str:
-        ### Identify _good_ and _bad_ letters from past guesses
+        # time spent saving the scores during the last guess (0 if none)
+        self.save_scores_s = 0.0
 
-        # 1. Get good letters (letters known to be in the gt)
-        letters_in_gt, good_letters = self.get_good_letters(past_guess_results)
-
-        # 2. Get bad letters (letters known _not_ to be in the gt)
-        # Note that this needs to be done _second_  as it uses the 'good_letters' information
-        # to deal with 'multiplicity'
-        _, bad_letters = self.get_bad_letters(past_guess_results, good_letters)
+    def guess(self, past_guess_results: list[GuessResult]) -> str:
+        self.save_scores_s = 0.0
 
         ### filter the pool of potential answers
-
-        # Remove a candidate if it:
-
-        # 1) contains any _bad_ letters
-        self.filter_on_bad_letter(bad_letters)
-
-        # 2) does not contain all _good_ letters OR does not contain them at the correct positions if they were perfect matches
-        self.filter_on_good_letters(letters_in_gt)
+        self.update_potential_answers(past_guess_results)
 
         # Early return if the pool of candidates has been reduced to a single word!
         if len(self.potential_answers) == 1:
@@ -66,10 +90,38 @@ class InfoTheory(Player):
         sorted_scores_per_word = dict(
             sorted(scores_per_word.items(), key=lambda item: item[1], reverse=True)
         )
-        self.save_scores(sorted_scores_per_word)
+        if self.save_dir is not None:
+            start = time.perf_counter()
+            self.save_scores(sorted_scores_per_word)
+            self.save_scores_s = time.perf_counter() - start
 
         return list(sorted_scores_per_word.items())[0][0]
 
+    def update_potential_answers(self, past_guess_results: list[GuessResult]):
+        """
+        Narrow 'self.potential_answers' down to the candidates consistent with
+        the known _good_ and _bad_ letters of the past guesses.
+        """
+        ### Identify _good_ and _bad_ letters from past guesses
+
+        # 1. Get good letters (letters known to be in the gt)
+        letters_in_gt, good_letters = self.get_good_letters(past_guess_results)
+
+        # 2. Get bad letters (letters known _not_ to be in the gt)
+        # Note that this needs to be done _second_  as it uses the 'good_letters' information
+        # to deal with 'multiplicity'
+        _, bad_letters = self.get_bad_letters(past_guess_results, good_letters)
+
+        ### filter the pool of potential answers
+
+        # Remove a candidate if it:
+
+        # 1) contains any _bad_ letters
+        self.filter_on_bad_letter(bad_letters)
+
+        # 2) does not contain all _good_ letters OR does not contain them at the correct positions if they were perfect matches
+        self.filter_on_good_letters(letters_in_gt)
+
     def get_good_letters(
         self, past_guess_results: list[GuessResult], debug: bool = False
     ) -> tuple[set[LetterResult], list[str]]:
@@ -178,6 +230,7 @@ class InfoTheory(Player):
             )
 
     def save_scores(self, scores: dict[str, float]):
+        assert self.save_dir is not None, "no save_dir to save the scores to"
         data = {
             "potential_answer_pool_size": self.potential_answers,
             "scores": {word: score for word, score in scores.items()},
@@ -0,0 +1,65 @@
+from src.info_theoretic_player import (
+    InfoTheory,
+    filter_vocab_on_size,
+    letter_elimination_table,
+)
+from src.sutom_engine import GuessResult
+
+
+class MultiBoardInfoTheory:
+    """Information theoretic player for several simultaneous boards.
+
+    Keeps one pool of potential answers per board, but scores each guess
+    once against all the pools: the per-pool letter elimination tables are
+    summed into a single joint table, and every word in the vocab is scored
+    with one pass over it. Solved boards are dropped from the computation.
+    """
+
+    def __init__(self, nb_boards: int, gt_length: int, vocab: list[str]):
+        self.gt_length = gt_length
+        self.vocab = filter_vocab_on_size(gt_length, vocab)
+
+        # one pool of potential answers per board, filtered with the same
+        # logic as the single-board player (their scores are never saved)
+        self.boards = [
+            InfoTheory(gt_length=gt_length, vocab=self.vocab, save_dir=None)
+            for _ in range(nb_boards)
+        ]
+
+    def guess(self, past_guess_results_per_board: list[list[GuessResult]]) -> str:
+        assert len(past_guess_results_per_board) == len(self.boards), (
+            "Expected one guess history per board"
+        )
+
+        active_boards = [
+            (board, past_guess_results)
+            for board, past_guess_results in zip(
+                self.boards, past_guess_results_per_board
+            )
+            if not (past_guess_results and past_guess_results[-1].is_perfect)
+        ]
+        assert active_boards, "All boards are already solved"
+
+        ### filter each active board's pool of potential answers
+        for board, past_guess_results in active_boards:
+            board.update_potential_answers(past_guess_results)
+
+        # Early return if a board's pool has been reduced to a single word
+        for board, _ in active_boards:
+            if len(board.potential_answers) == 1:
+                return board.potential_answers[0]
+
+        ### joint scores: sum of the expected #words eliminated on each board
+        joint_table: list[dict[str, float]] = [{} for _ in range(self.gt_length)]
+        for board, _ in active_boards:
+            table = letter_elimination_table(board.potential_answers, self.gt_length)
+            for joint_row, row in zip(joint_table, table):
+                for letter, expected in row.items():
+                    joint_row[letter] = joint_row.get(letter, 0.0) + expected
+
+        return max(
+            self.vocab,
+            key=lambda w: sum(
+                joint_row.get(letter, 0.0) for joint_row, letter in zip(joint_table, w)
+            ),
+        )
@@ -0,0 +1,40 @@
+from src.sutom_engine import GuessResult, SutomFSM
+
+
+class MultiSutomFSM:
+    """Several Sutom boards played simultaneously: each guess is checked
+    against every board that is not solved yet."""
+
+    def __init__(self, ground_truth_words: list[str]):
+        assert len(ground_truth_words) > 0, "need at least one board"
+        assert len({len(w) for w in ground_truth_words}) == 1, (
+            "All ground truth words must have the same length"
+        )
+
+        self.boards = [SutomFSM(gt_word) for gt_word in ground_truth_words]
+
+    @property
+    def gt_length(self) -> int:
+        return len(self.boards[0].gt_word)
+
+    @property
+    def solved(self) -> list[bool]:
+        return [
+            len(board.past_results) > 0 and board.past_results[-1].is_perfect
+            for board in self.boards
+        ]
+
+    @property
+    def is_solved(self) -> bool:
+        return all(self.solved)
+
+    @property
+    def past_results(self) -> list[list[GuessResult]]:
+        return [board.past_results for board in self.boards]
+
+    def guess(self, guess: str) -> list[GuessResult | None]:
+        "Check the guess against all unsolved boards (None for solved ones)"
+        return [
+            None if board_solved else board.guess(guess)
+            for board, board_solved in zip(self.boards, self.solved)
+        ]
@@ -1,20 +1,26 @@
+import time
 from pathlib import Path
 
 from rich.console import Console
 
+from src.game_log import GameLogger, TurnRecord
 from src.human_player import HumanPlayer
 from src.info_theoretic_player import InfoTheory
+from src.multi_board_player import MultiBoardInfoTheory
+from src.multi_sutom_engine import MultiSutomFSM
 from src.play_utils import (
     bad_guess_length,
+    check_multi_success,
     check_success,
     check_vocab,
     load_input_vocab,
     print_current_state,
     print_guess,
     print_guess_outcome,
+    print_multi_board_state,
 )
 from src.player import PlayerKind
-from src.sutom_engine import SutomFSM
+from src.sutom_engine import SutomFSM, pattern_from_guess_result
 
 DATA_DIR = Path("data")
 VOCAB_PATH = DATA_DIR / "vocab" / "fr" / "fr-nouns_filtered_normalized.txt"
@@ -29,6 +35,7 @@ def play(
     vocab_path: Path = VOCAB_PATH,
     max_iter: int = MAX_ITER,
     save_dir: Path = SAVE_DIR,
+    log_path: Path | None = None,
 ):
     console = Console()
     sutom_game = SutomFSM(ground_truth_word)
@@ -45,18 +52,88 @@ def play(
         case PlayerKind.AI:
             player = InfoTheory(gt_length=gt_length, vocab=vocab, save_dir=save_dir)
 
+    # optional append-only log of the game, see 'src/game_log.py'
+    logger, game_id = None, ""
+    if log_path is not None:
+        logger = GameLogger(log_path)
+        game_id = logger.start_game(
+            ground_truth_word,
+            player={
+                "kind": player_kind.value,
+                "vocab_path": str(vocab_path),
+                "max_iter": max_iter,
+            },
+        )
+
     for iter in range(1, max_iter + 1):
         print_current_state(iter, sutom_game, console)
 
         # the player comes up with a guess
+        start = time.perf_counter()
         guess = player.guess(sutom_game.past_results)
+        guess_s = time.perf_counter() - start
+        # saving the scores is not part of the decision: timed separately
+        save_scores_s = player.save_scores_s if isinstance(player, InfoTheory) else 0.0
         print_guess(guess, sutom_game.past_results, console)
         if bad_guess_length(guess, ground_truth_word, console):
             break
 
         # the game checks the guess against the ground-truth
+        start = time.perf_counter()
         guess_result = sutom_game.guess(guess)
+        feedback_s = time.perf_counter() - start
         print_guess_outcome(iter, guess_result, sutom_game, console)
 
+        if logger is not None:
+            logger.log_turn(
+                game_id,
+                TurnRecord(
+                    turn=iter,
+                    guess=guess,
+                    feedback=pattern_from_guess_result(guess_result),
+                    timings={
+                        "guess": guess_s - save_scores_s,
+                        "save_scores": save_scores_s,
+                        "feedback": feedback_s,
+                    },
+                ),
+            )
+
         if check_success(ground_truth_word, guess, console):
             break
+
+
+def play_multi(
+    ground_truth_words: list[str],
+    *,
+    vocab_path: Path = VOCAB_PATH,
+    max_iter: int = MAX_ITER,
+):
+    "Play several boards at once: each guess is checked against every unsolved board"
+    console = Console()
+    multi_game = MultiSutomFSM(ground_truth_words)
+
+    vocab = load_input_vocab(vocab_path)
+    for ground_truth_word in ground_truth_words:
+        check_vocab(ground_truth_word, vocab)
+
+    # NOTE: the player does *not* know 'ground_truth_words' values !
+    player = MultiBoardInfoTheory(
+        nb_boards=len(ground_truth_words),
+        gt_length=multi_game.gt_length,
+        vocab=vocab,
+    )
+
+    for iter in range(1, max_iter + 1):
+        print_multi_board_state(iter, multi_game, console)
+
+        # the player comes up with a single guess for all the boards
+        guess = player.guess(multi_game.past_results)
+        console.print(f"\n[blue]Guess: {guess}[/blue]")
+
+        # the game checks the guess against each unsolved board
+        multi_game.guess(guess)
+
+        if check_multi_success(multi_game, console):
+            print_multi_board_state(iter, multi_game, console)
+            break
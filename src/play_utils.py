@@ -2,6 +2,7 @@ from pathlib import Path
 
 from rich.console import Console
 
+from src.multi_sutom_engine import MultiSutomFSM
 from src.sutom_engine import GuessResult, LetterResult, LetterStatus, SutomFSM
 
 
@@ -10,7 +11,8 @@ def load_input_vocab(vocab_path: Path) -> list[str]:
 
     print("Loading vocab...")
     with open(vocab_path, "r") as f:
-        vocab = list(set([line.strip() for line in f if line.strip()]))
+        # sorted, so that the players' tie-breaks do not depend on the vocab order
+        vocab = sorted(set([line.strip() for line in f if line.strip()]))
     print("Vocab size:", len(vocab))
     return vocab
 
@@ -91,3 +93,35 @@ def check_success(gt: str, guess: str, console: Console) -> bool:
         return True
     else:
         return False
+
+
+def print_multi_board_state(iter: int, multi_game: MultiSutomFSM, console: Console):
+    console.print("\n\n")
+    print(f"----- ROUND #{iter} -----")
+
+    for board_idx, (board, board_solved) in enumerate(
+        zip(multi_game.boards, multi_game.solved)
+    ):
+        console.print(f"Board #{board_idx + 1}: ", end="")
+        for letter, letter_status in board.state_of_prediction:
+            match letter_status:
+                case LetterStatus.PERFECT_MATCH:
+                    console.print(letter, style="green", end="")
+                    console.print(" ", end="")
+                case _:
+                    console.print(" ", style="u", end="")
+                    console.print(" ", end="")
+        console.print("[bold green](solved)[/bold green]" if board_solved else "")
+    console.print("\n")
+    return
+
+
+def check_multi_success(multi_game: MultiSutomFSM, console: Console) -> bool:
+    if multi_game.is_solved:
+        console.print(
+            "[bold green]Congratulations! You guessed all"
+            + f" {len(multi_game.boards)} words![/bold green]"
+        )
+        return True
+    else:
+        return False
@@ -0,0 +1,94 @@
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.game_log import GameRecord, read_game_log
+from src.info_theoretic_player import InfoTheory
+from src.play_utils import load_input_vocab
+from src.player import PlayerKind
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    nb_games: int  # replayed games, i.e. played by the AI
+    nb_turns: int
+    nb_skipped_games: int  # games not played by the AI (e.g. human games)
+    mismatches: list[tuple[str, int, str, str]]  # game_id, turn, recorded, replayed
+    recorded_guess_s: float  # total time spent deciding in the recorded games
+    replayed_guess_s: float  # total time spent guessing during the replay
+
+    @property
+    def identical(self) -> bool:
+        return len(self.mismatches) == 0
+
+
+def replay_game(
+    game: GameRecord, vocab: list[str]
+) -> list[tuple[str, float]]:  # [(guess, seconds)]
+    """Feed the recorded history of a game, turn by turn, to a fresh
+    (headless) InfoTheory player and return the guesses it makes.
+
+    The player always sees the _recorded_ history, so a single diverging
+    decision does not derail the rest of the replay.
+    """
+    player = InfoTheory(gt_length=len(game.ground_truth), vocab=vocab, save_dir=None)
+    past_results = game.past_results
+
+    replayed = []
+    for turn in game.turns:
+        start = time.perf_counter()
+        guess = player.guess(past_results[: turn.turn - 1])
+        replayed.append((guess, time.perf_counter() - start))
+    return replayed
+
+
+def replay_log(log_path: Path, vocab_path: Path | None = None) -> ReplayReport:
+    """Replay all the AI games of a log. Each game is replayed with the vocab
+    it was played with, unless 'vocab_path' overrides it."""
+    games = read_game_log(log_path)
+
+    # only the AI decisions can be reproduced
+    ai_games = [game for game in games if game.player["kind"] == PlayerKind.AI.value]
+
+    vocabs: dict[Path, list[str]] = {}  # cached per vocab path
+
+    mismatches = []
+    recorded_guess_s, replayed_guess_s = 0.0, 0.0
+    for game in ai_games:
+        game_vocab_path = vocab_path or Path(game.player["vocab_path"])
+        if game_vocab_path not in vocabs:
+            vocabs[game_vocab_path] = load_input_vocab(game_vocab_path)
+
+        replayed = replay_game(game, vocabs[game_vocab_path])
+        for turn, (guess, seconds) in zip(game.turns, replayed):
+            recorded_guess_s += turn.timings.get("guess", 0.0)
+            replayed_guess_s += seconds
+            if guess != turn.guess:
+                mismatches.append((game.game_id, turn.turn, turn.guess, guess))
+
+    return ReplayReport(
+        nb_games=len(ai_games),
+        nb_turns=sum(len(game.turns) for game in ai_games),
+        nb_skipped_games=len(games) - len(ai_games),
+        mismatches=mismatches,
+        recorded_guess_s=recorded_guess_s,
+        replayed_guess_s=replayed_guess_s,
+    )
+
+
+if __name__ == "__main__":
+    report = replay_log(Path(sys.argv[1]))
+    print(
+        f"Replayed {report.nb_turns} turns of {report.nb_games} games:"
+        + f" {len(report.mismatches)} mismatching decisions"
+        + f" ({report.nb_skipped_games} non-AI games skipped)"
+    )
+    for game_id, turn_nb, recorded, replayed in report.mismatches:
+        print(
+            f"  game {game_id} turn {turn_nb}: recorded '{recorded}', replayed '{replayed}'"
+        )
+    print(
+        f"Guess time: recorded {report.recorded_guess_s:.3f}s,"
+        + f" replayed {report.replayed_guess_s:.3f}s"
+    )
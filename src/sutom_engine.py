@@ -21,6 +21,10 @@ class GuessResult:
     guess: str
     results: list[LetterResult]  # letter, position (0-indexed), result
 
+    @property
+    def is_perfect(self) -> bool:
+        return all(res.status == LetterStatus.PERFECT_MATCH for res in self.results)
+
 
 class SutomFSM:
     def __init__(self, ground_truth_word: str):
@@ -146,3 +150,64 @@ class SutomFSM:
         res = GuessResult(guess=guess, results=results)  # pyright: ignore
         self.past_results.append(res)
         return res
+
+
+# Statuses indexed by their 'trit' value in a packed feedback pattern
+PATTERN_STATUSES = (
+    LetterStatus.NOT_FOUND,
+    LetterStatus.FOUND_BUT_WRONG_POSITION,
+    LetterStatus.PERFECT_MATCH,
+)
+
+
+def feedback_pattern(guess: str, gt_word: str) -> int:
+    """Same feedback as 'SutomFSM.guess', packed into a single int.
+
+    Each letter gets a base-3 digit (see PATTERN_STATUSES), the letter at
+    position 0 being the least significant one. Much cheaper to compute,
+    hash and compare than a GuessResult.
+    """
+    trits = [0] * len(gt_word)
+    gt_counts_remaining: Counter[str] = Counter()
+
+    # Step 1: perfect matches, counting the non-matched gt letters
+    for i, (guess_letter, gt_letter) in enumerate(zip(guess, gt_word)):
+        if guess_letter == gt_letter:
+            trits[i] = 2
+        else:
+            gt_counts_remaining[gt_letter] += 1
+
+    # Step 2: letters found but at the wrong position
+    for i, guess_letter in enumerate(guess):
+        if trits[i] == 0 and gt_counts_remaining[guess_letter] > 0:
+            trits[i] = 1
+            gt_counts_remaining[guess_letter] -= 1
+
+    pattern = 0
+    for trit in reversed(trits):
+        pattern = pattern * 3 + trit
+    return pattern
+
+
+def perfect_pattern(gt_length: int) -> int:
+    "Packed pattern of a guess where every letter is a perfect match"
+    return 3**gt_length - 1
+
+
+def guess_result_from_pattern(guess: str, pattern: int) -> GuessResult:
+    "Unpack a feedback pattern (see 'feedback_pattern') into a GuessResult"
+    results = []
+    for i, letter in enumerate(guess):
+        pattern, trit = divmod(pattern, 3)
+        results.append(
+            LetterResult(letter=letter, position=i, status=PATTERN_STATUSES[trit])
+        )
+    return GuessResult(guess=guess, results=results)
+
+
+def pattern_from_guess_result(guess_result: GuessResult) -> int:
+    "Pack a GuessResult into a feedback pattern (see 'feedback_pattern')"
+    pattern = 0
+    for letter_result in reversed(guess_result.results):
+        pattern = pattern * 3 + PATTERN_STATUSES.index(letter_result.status)
+    return pattern